@@ -17,7 +17,7 @@ class ArgumentsTestCase(TestCase):
     def test_instantiate_empty(self):
         """Creating an L{Arguments} object."""
         arguments = Arguments({})
-        self.assertEqual({}, arguments.__dict__)
+        self.assertEqual({}, dict(arguments))
 
     def test_instantiate_non_empty(self):
         """Creating an L{Arguments} object with some arguments."""
@@ -228,6 +228,16 @@ class UnicodeTestCase(TestCase):
         parameter = Unicode("Test")
         self.assertEqual(u"cittá", parameter.parse("citt\xc3\xa1"))
 
+    def test_parse_already_unicode(self):
+        """
+        L{Unicode.parse} returns an already-decoded C{unicode} value as-is,
+        even if it contains non-ASCII characters.
+        """
+        parameter = Unicode("Test")
+        value = parameter.parse(u"cittá")
+        self.assertEqual(u"cittá", value)
+        self.assertTrue(isinstance(value, unicode))
+
     def test_format(self):
         """L{Unicode.format} encodes the given C{unicode} with utf-8."""
         parameter = Unicode("Test")
@@ -235,6 +245,13 @@ class UnicodeTestCase(TestCase):
         self.assertEqual("fo\xe1\x9d\xb0", value)
         self.assertTrue(isinstance(value, str))
 
+    def test_format_already_encoded(self):
+        """L{Unicode.format} returns an already-encoded C{str} untouched."""
+        parameter = Unicode("Test")
+        value = parameter.format("citt\xc3\xa1")
+        self.assertEqual("citt\xc3\xa1", value)
+        self.assertTrue(isinstance(value, str))
+
     def test_min_and_max(self):
         """The L{Unicode} parameter properly supports ranges."""
         parameter = Unicode("Test", min=2, max=4)